@@ -43,7 +43,8 @@ class KGCNLearner:
                  num_training_iterations=1000,
                  learning_rate=1e-3,
                  log_every_epochs=20,
-                 log_dir=None):
+                 log_dir=None,
+                 use_xla=False):
         """
         Args:
             tr_graphs: In-memory graphs of Grakn concepts for training
@@ -53,6 +54,9 @@ class KGCNLearner:
             num_training_iterations: Number of training iterations
             log_every_seconds: The time to wait between logging and printing the next set of results.
             log_dir: Directory to store TensorFlow events files
+            use_xla: Whether to turn on XLA auto-clustering (`global_jit_level=ON_1`), fusing the many small
+                element-wise ops into fewer kernels. In TensorFlow 1.14 this only clusters GPU ops, so it has no effect
+                on CPU unless `TF_XLA_FLAGS=--tf_xla_cpu_global_jit` is set. Its speed-up has not been measured
 
         Returns:
 
@@ -64,7 +68,7 @@ class KGCNLearner:
 
         # A list of outputs, one per processing step.
         output_ops_tr = self._model(input_ph, self._num_processing_steps_tr)
-        output_ops_ge = self._model(input_ph, self._num_processing_steps_ge)
+        output_ops_ge = self._model(input_ph, self._num_processing_steps_ge, is_training=False)
 
         # Training loss.
         loss_ops_tr = loss_ops_preexisting_no_penalty(target_ph, output_ops_tr)
@@ -93,7 +97,11 @@ class KGCNLearner:
 
         input_ph, target_ph = make_all_runnable_in_session(input_ph, target_ph)
 
-        sess = tf.Session()
+        config = tf.ConfigProto()
+        if use_xla:
+            config.graph_options.optimizer_options.global_jit_level = tf.OptimizerOptions.ON_1
+
+        sess = tf.Session(config=config)
         merged_summaries = tf.summary.merge_all()
 
         train_writer = None
@@ -118,9 +126,12 @@ class KGCNLearner:
               "Cge (test/generalization fraction nodes/edges labeled correctly), "
               "Sge (test/generalization fraction examples solved correctly)")
 
+        # The graphs don't change during training, so convert them to contiguous GraphsTuple arrays only once
+        tr_feed_dict = create_feed_dict(input_ph, target_ph, tr_input_graphs, tr_target_graphs)
+        ge_feed_dict = create_feed_dict(input_ph, target_ph, ge_input_graphs, ge_target_graphs)
+
         start_time = time.time()
         for iteration in range(num_training_iterations):
-            feed_dict = create_feed_dict(input_ph, target_ph, tr_input_graphs, tr_target_graphs)
 
             if iteration % log_every_epochs == 0:
 
@@ -132,19 +143,18 @@ class KGCNLearner:
                         "outputs": output_ops_tr,
                         "summary": merged_summaries
                     },
-                    feed_dict=feed_dict)
+                    feed_dict=tr_feed_dict)
 
                 if train_writer is not None:
                     train_writer.add_summary(train_values["summary"], iteration)
 
-                feed_dict = create_feed_dict(input_ph, target_ph, ge_input_graphs, ge_target_graphs)
                 test_values = sess.run(
                     {
                         "target": target_ph,
                         "loss": loss_op_ge,
                         "outputs": output_ops_ge
                     },
-                    feed_dict=feed_dict)
+                    feed_dict=ge_feed_dict)
                 correct_tr, solved_tr = existence_accuracy(
                     train_values["target"], train_values["outputs"][-1], use_edges=False)
                 correct_ge, solved_ge = existence_accuracy(
@@ -170,7 +180,7 @@ class KGCNLearner:
                         "loss": loss_op_tr,
                         "outputs": output_ops_tr
                     },
-                    feed_dict=feed_dict)
+                    feed_dict=tr_feed_dict)
 
         training_info = logged_iterations, losses_tr, losses_ge, corrects_tr, corrects_ge, solveds_tr, solveds_ge
         return train_values, test_values, training_info
@@ -36,12 +36,14 @@ class ContinuousAttribute(Attribute):
     def __init__(self, attr_embedding_dim, name='ContinuousAttributeEmbedder'):
         super(ContinuousAttribute, self).__init__(attr_embedding_dim, name=name)
 
-    def _build(self, attribute_value):
+        with self._enter_variable_scope():
+            self._mlp = snt.nets.MLP([self._attr_embedding_dim] * 3, activate_final=True, use_dropout=True)
+            self._layer_norm = snt.LayerNorm()
+
+    def _build(self, attribute_value, is_training=True):
         tf.summary.histogram('cont_attribute_value_histogram', attribute_value)
-        embedding = snt.Sequential([
-            snt.nets.MLP([self._attr_embedding_dim] * 3, activate_final=True, use_dropout=True),
-            snt.LayerNorm(),
-        ])(tf.cast(attribute_value, dtype=tf.float32))
+        # Dropout is only applied while training
+        embedding = self._layer_norm(self._mlp(tf.cast(attribute_value, dtype=tf.float32), is_training=is_training))
         tf.summary.histogram('cont_embedding_histogram', embedding)
         return embedding
 
@@ -52,10 +54,13 @@ class CategoricalAttribute(Attribute):
 
         self._num_categories = num_categories
 
-    def _build(self, attribute_value):
+        with self._enter_variable_scope():
+            self._embedder = snt.Embed(self._num_categories, self._attr_embedding_dim)
+
+    def _build(self, attribute_value, is_training=True):
         int_attribute_value = tf.cast(attribute_value, dtype=tf.int32)
         tf.summary.histogram('cat_attribute_value_histogram', int_attribute_value)
-        embedding = snt.Embed(self._num_categories, self._attr_embedding_dim)(int_attribute_value)
+        embedding = self._embedder(int_attribute_value)
         tf.summary.histogram('cat_embedding_histogram', embedding)
         return tf.squeeze(embedding, axis=1)
 
@@ -65,7 +70,7 @@ class BlankAttribute(Attribute):
     def __init__(self, attr_embedding_dim, name='BlankAttributeEmbedder'):
         super(BlankAttribute, self).__init__(attr_embedding_dim, name=name)
 
-    def _build(self, attribute_value):
+    def _build(self, attribute_value, is_training=True):
         shape = tf.stack([tf.shape(attribute_value)[0], self._attr_embedding_dim])
 
         encoded_features = tf.zeros(shape, dtype=tf.float32)
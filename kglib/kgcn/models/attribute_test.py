@@ -21,7 +21,7 @@ import unittest
 
 from unittest.mock import Mock, patch
 
-from kglib.kgcn.models.attribute import CategoricalAttribute
+from kglib.kgcn.models.attribute import CategoricalAttribute, ContinuousAttribute
 import tensorflow as tf
 
 from kglib.utils.test.utils import get_call_args
@@ -61,5 +61,18 @@ class TestCategoricalAttribute(tf.test.TestCase):
         self.assertEqual(get_call_args(self._mock_embed_instance)[0][0].dtype, tf.int32)
 
 
+class TestContinuousAttribute(tf.test.TestCase):
+
+    def test_output_is_deterministic_when_not_training(self):
+        inp = tf.constant([[0.1], [0.5], [0.9]], dtype=tf.float32)
+        cont = ContinuousAttribute(5)
+        first_output = cont(inp, is_training=False)
+        second_output = cont(inp, is_training=False)
+
+        self.evaluate(tf.global_variables_initializer())
+        first, second = self.evaluate([first_output, second_output])
+        self.assertAllClose(first, second)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -69,6 +69,27 @@ class MLPInteractionNetwork(snt.AbstractModule):
         return self._network(inputs)
 
 
+class KGEncoder(snt.AbstractModule):
+    """
+    Independently embeds the nodes of a graph according to their Things, and the edges according to their Roles.
+    """
+
+    def __init__(self, thing_embedder, role_embedder, latent_size=16, num_layers=2, name="kg_encoder"):
+        super(KGEncoder, self).__init__(name=name)
+
+        self._thing_embedder = thing_embedder
+        self._role_embedder = role_embedder
+
+        with self._enter_variable_scope():
+            self._edge_model = make_mlp_model(latent_size, num_layers)
+            self._node_model = make_mlp_model(latent_size, num_layers)
+
+    def _build(self, graph, is_training=True):
+        return graph.replace(
+            edges=self._edge_model(self._role_embedder(graph.edges)),
+            nodes=self._node_model(self._thing_embedder(graph.nodes, is_training=is_training)))
+
+
 class KGCN(snt.AbstractModule):
     """
     A KGCN Neural Network with Message Passing. Implemented as a Sonnet Module.
@@ -84,12 +105,6 @@ class KGCN(snt.AbstractModule):
                  name="KGCN"):
         super(KGCN, self).__init__(name=name)
 
-        self._thing_embedder = thing_embedder
-        self._role_embedder = role_embedder
-
-        self._latent_size = latent_size
-        self._num_layers = num_layers
-
         # Transforms the outputs into the appropriate shapes.
         if edge_output_size is None:
             edge_fn = None
@@ -100,26 +115,13 @@ class KGCN(snt.AbstractModule):
         else:
             node_fn = lambda: snt.Linear(node_output_size, name="node_output")
         with self._enter_variable_scope():
-            self._encoder = self._kg_encoder()
+            self._encoder = KGEncoder(thing_embedder, role_embedder, latent_size=latent_size, num_layers=num_layers)
             self._core = MLPInteractionNetwork()
             self._decoder = MLPGraphIndependent()
             self._output_transform = modules.GraphIndependent(edge_fn, node_fn)
 
-    def _edge_model(self):
-        return snt.Sequential([self._role_embedder,
-                               snt.nets.MLP([self._latent_size] * self._num_layers, activate_final=True),
-                               snt.LayerNorm()])
-
-    def _node_model(self):
-        return snt.Sequential([self._thing_embedder,
-                               snt.nets.MLP([self._latent_size] * self._num_layers, activate_final=True),
-                               snt.LayerNorm()])
-
-    def _kg_encoder(self):
-        return GraphIndependent(self._edge_model, self._node_model, name='kg_encoder')
-
-    def _build(self, input_op, num_processing_steps):
-        latent = self._encoder(input_op)
+    def _build(self, input_op, num_processing_steps, is_training=True):
+        latent = self._encoder(input_op, is_training=is_training)
         latent0 = latent
         output_ops = []
         for _ in range(num_processing_steps):
@@ -48,9 +48,18 @@ class ThingEmbedder(snt.AbstractModule):
             construct_non_attribute_embedders(node_types, attr_embedding_dim, categorical_attributes,
                                               continuous_attributes))
 
-    def _build(self, features):
-        return tf.concat([embed_type(features, len(self._node_types), self._type_embedding_dim),
-                          embed_attribute(features, self._attr_embedders, self._attr_embedding_dim)], axis=1)
+        # Construct the sub-modules once, so that every connection of this module reuses them
+        with self._enter_variable_scope():
+            self._type_embedder = snt.Embed(len(node_types), type_embedding_dim)
+            self._type_norm = snt.LayerNorm()
+            self._typewise_attribute_encoder = TypewiseEncoder(self._attr_embedders, attr_embedding_dim)
+
+    def _build(self, features, is_training=True):
+        # Cast the type column once, for use by both the type embedding and the typewise attribute encoding
+        types = tf.cast(features[:, 1], tf.int32)
+        return tf.concat([embed_type(features, self._type_embedder, self._type_norm, types=types),
+                          embed_attribute(features, self._typewise_attribute_encoder, is_training=is_training,
+                                          types=types)], axis=1)
 
 
 class RoleEmbedder(snt.AbstractModule):
@@ -59,22 +68,25 @@ class RoleEmbedder(snt.AbstractModule):
         self._num_edge_types = num_edge_types
         self._type_embedding_dim = type_embedding_dim
 
+        with self._enter_variable_scope():
+            self._type_embedder = snt.Embed(num_edge_types, type_embedding_dim)
+            self._type_norm = snt.LayerNorm()
+
     def _build(self, features):
-        return embed_type(features, self._num_edge_types, self._type_embedding_dim)
+        return embed_type(features, self._type_embedder, self._type_norm)
 
 
-def embed_type(features, num_types, type_embedding_dim):
+def embed_type(features, type_embedder, norm, types=None):
     preexistance_feat = tf.expand_dims(tf.cast(features[:, 0], dtype=tf.float32), axis=1)
-    type_embedder = snt.Embed(num_types, type_embedding_dim)
-    norm = snt.LayerNorm()
-    type_embedding = norm(type_embedder(tf.cast(features[:, 1], tf.int32)))
+    if types is None:
+        types = tf.cast(features[:, 1], tf.int32)
+    type_embedding = norm(type_embedder(types))
     tf.summary.histogram('type_embedding_histogram', type_embedding)
     return tf.concat([preexistance_feat, type_embedding], axis=1)
 
 
-def embed_attribute(features, attr_encoders, attr_embedding_dim):
-    typewise_attribute_encoder = TypewiseEncoder(attr_encoders, attr_embedding_dim)
-    attr_embedding = typewise_attribute_encoder(features[:, 1:])
+def embed_attribute(features, typewise_attribute_encoder, is_training=True, types=None):
+    attr_embedding = typewise_attribute_encoder(features[:, 1:], is_training=is_training, feat_types=types)
     tf.summary.histogram('attribute_embedding_histogram', attr_embedding)
     return attr_embedding
 
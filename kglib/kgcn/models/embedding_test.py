@@ -20,10 +20,11 @@
 import unittest
 
 import numpy as np
+import sonnet as snt
 import tensorflow as tf
 from unittest.mock import Mock
 from unittest.mock import patch
-from kglib.kgcn.models.embedding import embed_type, embed_attribute
+from kglib.kgcn.models.embedding import embed_type, embed_attribute, ThingEmbedder
 from kglib.utils.test.utils import get_call_args
 
 
@@ -34,7 +35,7 @@ class TestTypeEmbedding(unittest.TestCase):
     def test_embedding_output_shape_as_expected(self):
         features = np.array([[1, 0, 0.7], [1, 2, 0.7], [0, 1, 0.5]], dtype=np.float32)
         type_embedding_dim = 5
-        output = embed_type(features, 3, type_embedding_dim)
+        output = embed_type(features, snt.Embed(3, type_embedding_dim), snt.LayerNorm())
 
         np.testing.assert_array_equal(np.array([3, 6]), output.shape)
 
@@ -47,20 +48,34 @@ class TestAttributeEmbedding(unittest.TestCase):
         features = np.array([[1, 0, 0.7], [1, 2, 0.7], [0, 1, 0.5]])
 
         mock_instance = Mock(return_value=tf.convert_to_tensor(np.array([[1, 0.7], [1, 0.7], [0, 0.5]])))
-        mock = Mock(return_value=mock_instance)
-        patcher = patch('kglib.kgcn.models.embedding.TypewiseEncoder', spec=True, new=mock)
-        mock_class = patcher.start()
-
-        attr_encoders = Mock()
-        attr_embedding_dim = Mock()
 
-        embed_attribute(features, attr_encoders, attr_embedding_dim)  # Function under test
+        embed_attribute(features, mock_instance)  # Function under test
 
-        mock_class.assert_called_once_with(attr_encoders, attr_embedding_dim)
         call_args = get_call_args(mock_instance)
 
         np.testing.assert_array_equal([[np.array([[0, 0.7], [2, 0.7], [1, 0.5]])]], call_args)
 
+
+class TestThingEmbedder(unittest.TestCase):
+    def setUp(self):
+        tf.enable_eager_execution()
+
+    def test_typewise_encoder_constructed_once(self):
+        features = np.array([[1, 0, 0.7], [1, 2, 0.7], [0, 1, 0.5]], dtype=np.float32)
+
+        mock_instance = Mock(return_value=tf.zeros((3, 6), dtype=tf.float32))
+        mock = Mock(return_value=mock_instance)
+        patcher = patch('kglib.kgcn.models.embedding.TypewiseEncoder', spec=True, new=mock)
+        mock_class = patcher.start()
+
+        thing_embedder = ThingEmbedder(node_types=['a', 'b', 'c'], type_embedding_dim=5, attr_embedding_dim=6,
+                                       categorical_attributes={'a': ['a1', 'a2']}, continuous_attributes={'c': (0, 1)})
+        thing_embedder(features)
+        thing_embedder(features)
+
+        mock_class.assert_called_once_with(thing_embedder._attr_embedders, 6)
+        self.assertEqual(2, mock_instance.call_count)
+
         patcher.stop()
 
 
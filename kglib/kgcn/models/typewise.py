@@ -30,8 +30,10 @@ class TypewiseEncoder(snt.AbstractModule):
     def __init__(self, encoders_for_types, feature_length, name="typewise_encoder"):
         """
         Args:
-            encoders_for_types: Dict - keys: encoders; values: a list of type categories the encoder should be used for
-            feature_length: The length of features to output for matrix initialisation
+            encoders_for_types: Dict - keys: functions that construct encoders; values: a list of type categories the
+                encoder should be used for. Each encoder is called as `encoder(features, is_training=is_training)`
+            feature_length: The length of the features output by every encoder, checked when the encoders are
+                connected
             name: The name for this Module
         """
         super(TypewiseEncoder, self).__init__(name=name)
@@ -48,34 +50,47 @@ class TypewiseEncoder(snt.AbstractModule):
                 f'Encoder categories are inconsistent. Expected {expected_types}, but got {types_considered}')
 
         self._feature_length = feature_length
-        self._encoders_for_types = encoders_for_types
 
-    def _build(self, features):
+        # Construct each encoder once, so that every connection of this module reuses the same encoder modules
+        with self._enter_variable_scope():
+            self._encoders = [make_encoder() for make_encoder in encoders_for_types.keys()]
 
-        tf.summary.histogram('typewise_encoder_features_histogram', features)
-
-        shape = tf.stack([tf.shape(features)[0], self._feature_length])
-
-        encoded_features = tf.zeros(shape, dtype=tf.float32)
-
-        for encoder, types in self._encoders_for_types.items():
+        # Lookup from each type category to the index of the encoder that should be used for it
+        self._encoder_index_of_type = [0] * len(expected_types)
+        for encoder_index, types in enumerate(encoders_for_types.values()):
+            for typ in types:
+                self._encoder_index_of_type[typ] = encoder_index
 
-            feat_types = tf.cast(features[:, 0], tf.int32)  # The types for each feature, as integers
+    def _build(self, features, is_training=True, feat_types=None):
 
-            # Expand dimensions ready for element-wise equality comparison
-            exp_types = tf.expand_dims(types, axis=0)
-            exp_feat_types = tf.expand_dims(feat_types, axis=1)
-
-            elementwise_equality = tf.equal(exp_feat_types, exp_types)
-
-            # Use this encoder when the feat_type matches any of the types
-            applicable_types_mask = tf.reduce_any(elementwise_equality, axis=1)
-            indices_to_encode = tf.where(applicable_types_mask)
-
-            feats_to_encode = tf.squeeze(tf.gather(features[:, 1:], indices_to_encode), axis=1)
-            encoded_feats = encoder()(feats_to_encode)
+        tf.summary.histogram('typewise_encoder_features_histogram', features)
 
-            encoded_features += tf.scatter_nd(tf.cast(indices_to_encode, dtype=tf.int32), encoded_feats, shape)
+        # The types for each feature, as integers. Callers that already hold these can pass them to skip the cast
+        if feat_types is None:
+            feat_types = tf.cast(features[:, 0], tf.int32)
+
+        # Every type must have an encoder, otherwise the lookup of its encoder would be out of bounds
+        num_types = len(self._encoder_index_of_type)
+        type_checks = [
+            tf.debugging.assert_non_negative(feat_types, message='Feature types must be non-negative'),
+            tf.debugging.assert_less(feat_types, num_types,
+                                     message=f'Feature types must be less than {num_types}, the number of types '
+                                             f'with an encoder'),
+        ]
+        with tf.control_dependencies(type_checks):
+            partitions = tf.gather(tf.constant(self._encoder_index_of_type, dtype=tf.int32), feat_types)
+
+        # Split the features and their row indices into one contiguous group per encoder in a single pass, rather
+        # than masking and gathering the whole feature Tensor once per encoder
+        num_encoders = len(self._encoders)
+        feats_for_encoders = tf.dynamic_partition(features[:, 1:], partitions, num_encoders)
+        indices_for_encoders = tf.dynamic_partition(tf.range(tf.shape(features)[0]), partitions, num_encoders)
+
+        encoded_feats = [tf.ensure_shape(encoder(feats, is_training=is_training), [None, self._feature_length])
+                         for encoder, feats in zip(self._encoders, feats_for_encoders)]
+
+        # Reassemble the encodings in the original order of the features
+        encoded_features = tf.dynamic_stitch(indices_for_encoders, encoded_feats)
 
         tf.summary.histogram('typewise_encoder_encoded_features_histogram', encoded_features)
 
@@ -37,8 +37,8 @@ class ITTypewiseEncoder(unittest.TestCase):
 
         things = tf.convert_to_tensor(np.array([[0, 0], [1, 0], [2, 0.5673]], dtype=np.float32))
 
-        entity_relation = lambda x: x
-        continuous_attribute = lambda x: x
+        entity_relation = lambda x, is_training: x
+        continuous_attribute = lambda x, is_training: x
 
         encoders_for_types = {lambda: entity_relation: [0, 1], lambda: continuous_attribute: [2]}
 
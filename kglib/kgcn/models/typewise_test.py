@@ -64,6 +64,69 @@ class TestTypewiseEncoder(unittest.TestCase):
         expected_encoding = np.array([[0.1, 0, 0], [0.1, 0, 0], [0.1, 0, 0]], dtype=np.float32)
         np.testing.assert_array_equal(expected_encoding, encoding.numpy())
 
+    def test_interleaved_types_encoded_in_original_order(self):
+        things = np.array([[2, 0.1], [0, 0], [2, 0.2], [1, 0]], dtype=np.float32)
+
+        mock_entity_relation_encoder = Mock(return_value=np.array([[0, 0, 0], [0, 0, 0]], dtype=np.float32))
+
+        mock_attribute_encoder = Mock(return_value=np.array([[0.1, 0.1, 0.1], [0.2, 0.2, 0.2]], dtype=np.float32))
+
+        encoders_for_types = {lambda: mock_entity_relation_encoder: [0, 1], lambda: mock_attribute_encoder: [2]}
+
+        tm = TypewiseEncoder(encoders_for_types, 3)
+        encoding = tm(things)  # The function under test
+
+        np.testing.assert_array_equal([[np.array([[0.1], [0.2]], dtype=np.float32)]],
+                                      get_call_args(mock_attribute_encoder))
+
+        expected_encoding = np.array([[0.1, 0.1, 0.1], [0, 0, 0], [0.2, 0.2, 0.2], [0, 0, 0]], dtype=np.float32)
+        np.testing.assert_array_equal(expected_encoding, encoding.numpy())
+
+    def test_given_types_are_used(self):
+        things = np.array([[0, 0], [0, 0.5673]], dtype=np.float32)
+        feat_types = np.array([0, 1], dtype=np.int32)
+
+        mock_entity_relation_encoder = Mock(return_value=np.array([[0, 0, 0]], dtype=np.float32))
+
+        mock_attribute_encoder = Mock(return_value=np.array([[0.9527, 0.2367, 0.7582]], dtype=np.float32))
+
+        encoders_for_types = {lambda: mock_entity_relation_encoder: [0], lambda: mock_attribute_encoder: [1]}
+
+        tm = TypewiseEncoder(encoders_for_types, 3)
+        encoding = tm(things, feat_types=feat_types)  # The function under test
+
+        np.testing.assert_array_equal([[np.array([[0.5673]], dtype=np.float32)]], get_call_args(mock_attribute_encoder))
+
+        expected_encoding = np.array([[0, 0, 0], [0.9527, 0.2367, 0.7582]], dtype=np.float32)
+        np.testing.assert_array_equal(expected_encoding, encoding.numpy())
+
+    def test_type_without_encoder_raises(self):
+        things = np.array([[0, 0], [3, 0]], dtype=np.float32)
+
+        mock_entity_relation_encoder = Mock(return_value=np.array([[0, 0, 0]], dtype=np.float32))
+
+        encoders_for_types = {lambda: mock_entity_relation_encoder: [0, 1, 2]}
+
+        tm = TypewiseEncoder(encoders_for_types, 3)
+
+        with self.assertRaises(tf.errors.InvalidArgumentError):
+            tm(things)  # The function under test
+
+    def test_is_training_passed_to_encoders(self):
+        things = np.array([[0, 0], [1, 0], [2, 0.5673]], dtype=np.float32)
+
+        mock_entity_relation_encoder = Mock(return_value=np.array([[0, 0, 0], [0, 0, 0]], dtype=np.float32))
+
+        mock_attribute_encoder = Mock(return_value=np.array([[0.9527, 0.2367, 0.7582]], dtype=np.float32))
+
+        encoders_for_types = {lambda: mock_entity_relation_encoder: [0, 1], lambda: mock_attribute_encoder: [2]}
+
+        tm = TypewiseEncoder(encoders_for_types, 3)
+        tm(things, is_training=False)  # The function under test
+
+        self.assertDictEqual({'is_training': False}, mock_entity_relation_encoder.call_args_list[0][1])
+        self.assertDictEqual({'is_training': False}, mock_attribute_encoder.call_args_list[0][1])
+
     def test_encoders_do_not_fulfil_classes(self):
         mock_entity_relation_encoder = Mock()
 
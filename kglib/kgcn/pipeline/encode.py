@@ -19,18 +19,20 @@
 
 import numpy as np
 
-from kglib.utils.graph.iterate import multidigraph_data_iterator, multidigraph_node_data_iterator, \
-    multidigraph_edge_data_iterator
+from kglib.utils.graph.iterate import multidigraph_node_data_iterator, multidigraph_edge_data_iterator
 
 
 def encode_values(graph, categorical_attributes, continuous_attributes):
+    if categorical_attributes is not None:
+        # Look up the integer value of each category directly, rather than searching the list of categories each time
+        index_of_category = {typ: _first_index_map(categories) for typ, categories in categorical_attributes.items()}
+
     for node_data in multidigraph_node_data_iterator(graph):
         typ = node_data['type']
 
         if categorical_attributes is not None and typ in categorical_attributes.keys():
             # Add the integer value of the category for each categorical attribute instance
-            category_values = categorical_attributes[typ]
-            node_data['encoded_value'] = category_values.index(node_data['value'])
+            node_data['encoded_value'] = _index_of(index_of_category[typ], node_data['value'])
 
         elif continuous_attributes is not None and typ in continuous_attributes.keys():
             min_val, max_val = continuous_attributes[typ]
@@ -57,46 +59,116 @@ def encode_types(graph, iterator_func, types):
 
     """
     iterator = iterator_func(graph)
+    index_of_type = _first_index_map(types)
 
     for data in iterator:
-        data['categorical_type'] = types.index(data['type'])
+        data['categorical_type'] = _index_of(index_of_type, data['type'])
 
     return graph
 
 
-def create_input_graph(graph):
-    input_graph = graph.copy()
+def _first_index_map(values):
+    """
+    Maps each value to the index of its first occurrence in `values`, matching `list.index`
+    """
+    index_map = {}
+    for i, value in enumerate(values):
+        index_map.setdefault(value, i)
+    return index_map
 
-    for data in multidigraph_data_iterator(input_graph):
-        if data["solution"] == 0:
-            preexists = 1
-        else:
-            preexists = 0
 
-        features = stack_features([preexists, data["categorical_type"], data["encoded_value"]])
-        data.clear()
-        data["features"] = features
+def _index_of(index_map, value):
+    """
+    Looks up the index of `value` in a map from `_first_index_map`, raising `ValueError` if absent, as `list.index`
+    """
+    try:
+        return index_map[value]
+    except KeyError:
+        raise ValueError(f'{value!r} is not in list') from None
 
-    input_graph.graph["features"] = np.array([0.0] * 5, dtype=np.float32)
-    return input_graph
+
+def create_input_graph(graph):
+    """
+    Creates a graph with the same structure as `graph`, holding only the input features of each node and edge
+    """
+    return _create_features_graph(graph, _input_features)
 
 
 def create_target_graph(graph):
-    target_graph = graph.copy()
-    solution_one_hot_encoding = np.array([[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]], dtype=np.float32)
+    """
+    Creates a graph with the same structure as `graph`, holding only the target features of each node and edge
+    """
+    return _create_features_graph(graph, _target_features)
 
-    for data in multidigraph_data_iterator(target_graph):
-        features = solution_one_hot_encoding[data["solution"]]
-        data.clear()
-        data["features"] = features
 
-    target_graph.graph["features"] = np.array([0.0] * 5, dtype=np.float32)
-    return target_graph
+def create_input_target_graphs(graph):
+    """
+    Creates both the input graph and the target graph for `graph`, reading the elements of `graph` only once
+
+    Args:
+        graph: The encoded graph
+
+    Returns:
+        The input graph and the target graph
+    """
+    nodes, edges, data_list = _graph_elements(graph)
+    input_graph = _graph_with_features(graph, nodes, edges, _input_features(data_list))
+    target_graph = _graph_with_features(graph, nodes, edges, _target_features(data_list))
+    return input_graph, target_graph
+
+
+def _create_features_graph(graph, features_func):
+    nodes, edges, data_list = _graph_elements(graph)
+    return _graph_with_features(graph, nodes, edges, features_func(data_list))
+
+
+def _graph_elements(graph):
+    nodes = list(graph._node.items())
+    edges = [(sender, receiver, key, data)
+             for sender, receivers in graph._adj.items()
+             for receiver, keyed_edges in receivers.items()
+             for key, data in keyed_edges.items()]
+    data_list = [data for _, data in nodes] + [data for _, _, _, data in edges]
+    return nodes, edges, data_list
+
+
+def _graph_with_features(graph, nodes, edges, features):
+    """
+    Builds a new graph with the nodes and edges of `graph`, with each element carrying only its row of `features`.
+    This avoids copying, and then clearing, all of the existing node and edge data of `graph`
+    """
+    features_graph = graph.__class__()
+    features_graph.graph.update(graph.graph)
+    features_graph.graph["features"] = np.array([0.0] * 5, dtype=np.float32)
+
+    num_nodes = len(nodes)
+    features_graph.add_nodes_from(
+        (node, {"features": node_features}) for (node, _), node_features in zip(nodes, features[:num_nodes]))
+    features_graph.add_edges_from(
+        (sender, receiver, key, {"features": edge_features})
+        for (sender, receiver, key, _), edge_features in zip(edges, features[num_nodes:]))
+
+    return features_graph
+
+
+def _input_features(data_list):
+    # Build the features of all nodes and edges as rows of one matrix, rather than stacking a small array per element
+    return np.array(
+        [(1 if data["solution"] == 0 else 0, data["categorical_type"], data["encoded_value"]) for data in data_list],
+        dtype=np.float32).reshape(len(data_list), 3)
+
+
+def _target_features(data_list):
+    solution_one_hot_encoding = np.array([[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]], dtype=np.float32)
+    # Gather the one-hot encodings of all solutions at once with a single fancy-index
+    solutions = np.fromiter((data["solution"] for data in data_list), dtype=np.int64, count=len(data_list))
+    return solution_one_hot_encoding[solutions]
 
 
 def stack_features(features):
     """
-    Stacks features together into a single vector
+    Stacks features together into a single vector. Kept as a public utility; the pipeline itself builds its input
+    features as a single matrix in `_input_features`
 
     Args:
         features: iterable of features, features can be a single value or iterable
@@ -19,9 +19,12 @@
 
 import unittest
 
+import networkx as nx
 import numpy as np
 
-from kglib.kgcn.pipeline.encode import stack_features
+from kglib.kgcn.pipeline.encode import stack_features, create_input_graph, create_input_target_graphs, encode_types, \
+    encode_values
+from kglib.utils.graph.iterate import multidigraph_node_data_iterator
 
 
 class TestAugmentDataFields(unittest.TestCase):
@@ -45,5 +48,91 @@ class TestAugmentDataFields(unittest.TestCase):
         np.testing.assert_equal(stacked, expected)
 
 
+class TestEncodeTypes(unittest.TestCase):
+
+    def test_types_encoded_by_index(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, type='person')
+        graph.add_node(1, type='name')
+
+        encode_types(graph, multidigraph_node_data_iterator, ['name', 'company', 'person'])
+
+        self.assertEqual(2, graph.nodes[0]['categorical_type'])
+        self.assertEqual(0, graph.nodes[1]['categorical_type'])
+
+    def test_duplicate_types_encoded_by_first_index(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, type='person')
+
+        encode_types(graph, multidigraph_node_data_iterator, ['person', 'name', 'person'])
+
+        self.assertEqual(0, graph.nodes[0]['categorical_type'])
+
+    def test_unknown_type_raises_value_error(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, type='company')
+
+        with self.assertRaises(ValueError):
+            encode_types(graph, multidigraph_node_data_iterator, ['person', 'name'])
+
+
+class TestEncodeValues(unittest.TestCase):
+
+    def test_values_encoded_as_expected(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, type='colour', value='blue')
+        graph.add_node(1, type='age', value=30)
+        graph.add_node(2, type='person')
+        graph.add_edge(2, 1, type='has')
+
+        encode_values(graph, {'colour': ['red', 'green', 'blue']}, {'age': (20, 40)})
+
+        self.assertEqual(2, graph.nodes[0]['encoded_value'])
+        self.assertEqual(0.5, graph.nodes[1]['encoded_value'])
+        self.assertEqual(0, graph.nodes[2]['encoded_value'])
+        self.assertEqual(0, graph.edges[2, 1, 0]['encoded_value'])
+
+
+class TestCreateInputGraph(unittest.TestCase):
+
+    def test_features_created_as_expected(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, solution=0, categorical_type=2, encoded_value=0.5)
+        graph.add_node(1, solution=1, categorical_type=0, encoded_value=0)
+        graph.add_edge(0, 1, solution=2, categorical_type=1, encoded_value=0)
+
+        input_graph = create_input_graph(graph)
+
+        np.testing.assert_equal(np.array([1, 2, 0.5], dtype=np.float32), input_graph.nodes[0]['features'])
+        np.testing.assert_equal(np.array([0, 0, 0], dtype=np.float32), input_graph.nodes[1]['features'])
+        np.testing.assert_equal(np.array([0, 1, 0], dtype=np.float32), input_graph.edges[0, 1, 0]['features'])
+
+    def test_only_features_are_kept(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, solution=0, categorical_type=2, encoded_value=0.5, type='person')
+
+        input_graph = create_input_graph(graph)
+
+        self.assertListEqual(['features'], list(input_graph.nodes[0].keys()))
+        self.assertIn('type', graph.nodes[0])
+
+
+class TestCreateInputTargetGraphs(unittest.TestCase):
+
+    def test_input_and_target_features_created_as_expected(self):
+        graph = nx.MultiDiGraph(name=0)
+        graph.add_node(0, solution=0, categorical_type=2, encoded_value=0.5)
+        graph.add_node(1, solution=1, categorical_type=0, encoded_value=0)
+        graph.add_edge(0, 1, solution=2, categorical_type=1, encoded_value=0)
+
+        input_graph, target_graph = create_input_target_graphs(graph)
+
+        np.testing.assert_equal(np.array([1, 2, 0.5], dtype=np.float32), input_graph.nodes[0]['features'])
+        np.testing.assert_equal(np.array([0, 1, 0], dtype=np.float32), input_graph.edges[0, 1, 0]['features'])
+        np.testing.assert_equal(np.array([0, 1, 0], dtype=np.float32), target_graph.nodes[1]['features'])
+        np.testing.assert_equal(np.array([0, 0, 1], dtype=np.float32), target_graph.edges[0, 1, 0]['features'])
+        self.assertEqual(0, target_graph.graph['name'])
+
+
 if __name__ == "__main__":
     unittest.main()
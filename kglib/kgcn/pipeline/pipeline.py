@@ -24,7 +24,7 @@ from graph_nets.utils_np import graphs_tuple_to_networkxs
 from kglib.kgcn.learn.learn import KGCNLearner
 from kglib.kgcn.models.core import softmax, KGCN
 from kglib.kgcn.models.embedding import ThingEmbedder, RoleEmbedder
-from kglib.kgcn.pipeline.encode import encode_types, create_input_graph, create_target_graph, encode_values
+from kglib.kgcn.pipeline.encode import encode_types, create_input_target_graphs, encode_values
 from kglib.kgcn.pipeline.utils import apply_logits_to_graphs, duplicate_edges_in_reverse
 from kglib.kgcn.plot.plotting import plot_across_training, plot_predictions
 from kglib.utils.graph.iterate import multidigraph_node_data_iterator, multidigraph_data_iterator, \
@@ -44,7 +44,8 @@ def pipeline(graphs,
              attr_embedding_dim=6,
              edge_output_size=3,
              node_output_size=3,
-             output_dir=None):
+             output_dir=None,
+             use_xla=False):
 
     ############################################################
     # Manipulate the graph data
@@ -59,8 +60,9 @@ def pipeline(graphs,
     graphs = [encode_types(graph, multidigraph_node_data_iterator, node_types) for graph in graphs]
     graphs = [encode_types(graph, multidigraph_edge_data_iterator, edge_types) for graph in graphs]
 
-    input_graphs = [create_input_graph(graph) for graph in graphs]
-    target_graphs = [create_target_graph(graph) for graph in graphs]
+    input_target_graphs = [create_input_target_graphs(graph) for graph in graphs]
+    input_graphs = [input_graph for input_graph, _ in input_target_graphs]
+    target_graphs = [target_graph for _, target_graph in input_target_graphs]
 
     tr_input_graphs = input_graphs[:tr_ge_split]
     tr_target_graphs = target_graphs[:tr_ge_split]
@@ -90,7 +92,8 @@ def pipeline(graphs,
                                                  ge_input_graphs,
                                                  ge_target_graphs,
                                                  num_training_iterations=num_training_iterations,
-                                                 log_dir=output_dir)
+                                                 log_dir=output_dir,
+                                                 use_xla=use_xla)
 
     plot_across_training(*tr_info, output_file=f'{output_dir}learning.png')
     plot_predictions(graphs[tr_ge_split:], test_values, num_processing_steps_ge, output_file=f'{output_dir}graph.png')